@@ -1,6 +1,8 @@
+import os
+import re
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-import os
+from types import MappingProxyType
 
 LANGUAGE_CHOICES = [
     ("ja", "日本語"),
@@ -25,9 +27,10 @@ LANGUAGE_CHOICES = [
     ("zh_Hant_TW", "繁體中文"),
 ]
 
-LANGUAGE_NAMES = {code: name for code, name in LANGUAGE_CHOICES}
+# 実行中に変更されない前提なので読み取り専用にしておく
+LANGUAGE_NAMES = MappingProxyType(dict(LANGUAGE_CHOICES))
 
-SUPPORTED_LOCALES = [code for code, _ in LANGUAGE_CHOICES]
+SUPPORTED_LOCALES = tuple(code for code, _ in LANGUAGE_CHOICES)
 
 SEARCH_CACHE = {
     "7TO": "/__year__/top_7tosmoke",
@@ -77,6 +80,9 @@ SEARCH_CACHE = {
     "現地観戦計画のたてかた": "/travel/top",
 }
 
+# 検索語は大文字化して照合するため、キーも大文字に正規化して読み取り専用にする
+SEARCH_CACHE = MappingProxyType({key.upper(): url for key, url in SEARCH_CACHE.items()})
+
 FOLIUM_CUSTOM_CSS = """
 <style>
     /* より強い詳細度でBootstrapのスタイルを上書き */
@@ -113,24 +119,33 @@ ISO_CODE_NOT_FOUND = "beatboxer_dataにiso_codeが存在しません Participant
 COUNTRY_NAMES_OR_ALPHA2_NOT_FOUND = "ParticipantMemberにCountry(names, iso_alpha2)が存在しません Participantテーブルを取得する際に、Country(names, iso_alpha2)をjoinさせてください"
 COUNTRY_ISO_ALPHA2_NOT_FOUND = "ParticipantMemberにCountry(iso_alpha2)が存在しません Participantテーブルを取得する際に、Country(iso_alpha2)をjoinさせてください"
 
-YOUTUBE_CHANNEL_PATTERN = (
-    r"^(https?:\/\/)?(www\.)?youtube\.com\/(c\/|channel\/|user\/|@)[a-zA-Z0-9_-]+\/?$"
+# 呼び出しごとの re モジュール内キャッシュ参照を避けるため、import 時にコンパイルしておく
+# ドメインは大文字小文字を区別しないため IGNORECASE を付ける
+YOUTUBE_CHANNEL_PATTERN = re.compile(
+    r"^(https?:\/\/)?(www\.)?youtube\.com\/(c\/|channel\/|user\/|@)[a-zA-Z0-9_-]+\/?$",
+    re.IGNORECASE,
+)
+INSTAGRAM_ACCOUNT_PATTERN = re.compile(
+    r"^(https?:\/\/)?(www\.)?instagram\.com\/[a-zA-Z0-9_.]+\/?$", re.IGNORECASE
 )
-INSTAGRAM_ACCOUNT_PATTERN = r"^(https?:\/\/)?(www\.)?instagram\.com\/[a-zA-Z0-9_.]+\/?$"
-FACEBOOK_ACCOUNT_PATTERN = (
-    r"^(https?:\/\/)?((www|m)\.)?facebook\.com\/[a-zA-Z0-9_.]+\/?$"
+FACEBOOK_ACCOUNT_PATTERN = re.compile(
+    r"^(https?:\/\/)?((www|m)\.)?facebook\.com\/[a-zA-Z0-9_.]+\/?$", re.IGNORECASE
 )
-SPOTIFY_ACCOUNT_PATTERN = (
-    r"^(https?:\/\/)?(open\.)?spotify\.com\/artist\/[a-zA-Z0-9]+\/?$"
+SPOTIFY_ACCOUNT_PATTERN = re.compile(
+    r"^(https?:\/\/)?(open\.)?spotify\.com\/artist\/[a-zA-Z0-9]+\/?$", re.IGNORECASE
 )
-TWITTER_ACCOUNT_PATTERN = (
-    r"^(https?:\/\/)?(www\.)?(twitter\.com|x\.com)\/[a-zA-Z0-9_]+\/?$"
+TWITTER_ACCOUNT_PATTERN = re.compile(
+    r"^(https?:\/\/)?(www\.)?(twitter\.com|x\.com)\/[a-zA-Z0-9_]+\/?$", re.IGNORECASE
 )
-SOUNDCLOUD_ACCOUNT_PATTERN = (
-    r"^(https?:\/\/)?(www\.)?soundcloud\.com\/[a-zA-Z0-9_-]+\/?$"
+SOUNDCLOUD_ACCOUNT_PATTERN = re.compile(
+    r"^(https?:\/\/)?(www\.)?soundcloud\.com\/[a-zA-Z0-9_-]+\/?$", re.IGNORECASE
 )
 
-BAN_WORDS = ["HATEN", "BEATCITY", "BCJ", "JPN CUP", "WIKI", "/PLAYLIST"]
+# 部分一致の判定は BAN_WORDS_PATTERN で行うため、順序が固定された tuple で持つ
+BAN_WORDS = ("HATEN", "BEATCITY", "BCJ", "JPN CUP", "WIKI", "/PLAYLIST")
+
+# 禁止ワードのいずれかを含むかを1回の検索で判定する（大文字小文字は区別しない）
+BAN_WORDS_PATTERN = re.compile("|".join(map(re.escape, BAN_WORDS)), re.IGNORECASE)
 
 FLAG_CODE = """
 <picture>
@@ -151,12 +166,40 @@ FLAG_CODE = """
 </picture>
 """
 
-BASE_DIR = Path(__file__).resolve().parent.parent.parent
+# resolve() はシンボリックリンク解決でファイルシステムを辿るため、abspath で済ませる
+BASE_DIR = Path(os.path.abspath(__file__)).parents[2]
 
 MINUTE = 60
 HOUR = 60 * MINUTE
 
-LAST_UPDATED = datetime.now(timezone(timedelta(hours=9)))
+JST = timezone(timedelta(hours=9))
+
+
+def _parse_last_updated(value):
+    """
+    環境変数 LAST_UPDATED の値からデプロイ時刻を作る。
+
+    Args:
+        value (str | None): ISO 8601 形式の日時。未設定の場合は None または空文字。
+
+    Returns:
+        datetime: タイムゾーン付きの日時。未設定の場合はプロセス起動時刻。
+
+    Note:
+        オフセットの無い日時は UTC として整形されてしまうため、日本時間とみなす。
+    """
+    if not value:
+        return datetime.now(JST)
+
+    last_updated = datetime.fromisoformat(value)
+    if last_updated.tzinfo is None:
+        last_updated = last_updated.replace(tzinfo=JST)
+    return last_updated
+
+
+# 環境変数 LAST_UPDATED（ISO 8601）でデプロイ時刻を固定できる
+# 未設定の場合はプロセス起動時刻
+LAST_UPDATED = _parse_last_updated(os.getenv("LAST_UPDATED"))
 
 ALL_DATA = "*"
 
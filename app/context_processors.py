@@ -1,69 +1,180 @@
+import os
 import re
 from datetime import datetime, timezone
-from functools import lru_cache
-from itertools import product
-from threading import Thread
-from urllib.parse import urlparse, urlunparse
+from functools import cache, lru_cache, wraps
+from threading import Lock, Thread
+from urllib.parse import quote
 
-from dateutil import parser
-from flask import abort, redirect, request, session
-from flask_babel import format_datetime
+from babel.dates import format_datetime
+from flask import abort, g, has_request_context, redirect, request, session
+from flask_babel import get_timezone
 
 from app.config.config import (
     BASE_DIR,
     HOUR,
     LANGUAGE_CHOICES,
     LAST_UPDATED,
+    MINUTE,
     SUPPORTED_LOCALES,
 )
 from app.models.supabase_client import supabase_service
 from app.util.filter_eq import Operator
 from app.util.locale import get_validated_language
 
+# messages.po の参照パスのうち、URLにならないテンプレートの除外条件
+_EXCLUDE_TEMPLATE_RE = re.compile(r"includes/|base\.html|404\.html")
+# messages.po のテンプレート参照コメント行から "#: " 以降を取り出す
+_PO_REFERENCE_RE = re.compile(rb"^#: (templates/.+)$", re.MULTILINE)
+# テンプレートパスから URL 部分だけを切り出すためのスライス位置
+_COMMON_PREFIX_LEN = len("common/")
+_HTML_SUFFIX_START = -len(".html")
+# 空白区切りの参照パス列から、各パスのテンプレート部分を抜き出す
+_TEMPLATE_PATH_RE = re.compile(r"(?:^| )templates/(\S+?\.html)")
 
-# MARK: 年度一覧
-def get_available_years():
+# リクエストパスの2番目のセグメント（/{lang}/{year}/...）から年度を取り出す
+_YEAR_SEGMENT_RE = re.compile(r"/[^/]*/(\d+)(?:/|$)")
+
+# 言語切り替えURLの生成用に、言語ごとのパス接頭辞を事前に作っておく
+_LANGUAGE_PREFIXES = tuple((f"/{code}/", name) for code, name in LANGUAGE_CHOICES)
+
+# get_translated_urls の同時生成を防ぐロック
+_translated_urls_lock = Lock()
+
+# 言語ごとに整形済みの最終更新日時（LAST_UPDATED はプロセス中で変わらない）
+_LAST_UPDATED_CACHE = {}
+
+
+# MARK: リクエスト内キャッシュ
+def _memoize_per_request(func):
     """
-    年度一覧を取得する関数。
+    同一リクエスト内では、初回の戻り値を flask.g に保存して使い回すデコレータ。
+
+    コンテキストプロセッサとビューが同じ取得関数を呼んでも、
+    キャッシュサーバーへの問い合わせは1リクエストにつき1回で済む。
+    リクエストコンテキスト外（起動時のスレッドなど）ではそのまま呼び出す。
+    """
+    attr_name = f"_{func.__name__}"
+
+    @wraps(func)
+    def wrapper():
+        if not has_request_context():
+            return func()
+
+        result = g.get(attr_name)
+        if result is None:
+            result = func()
+            setattr(g, attr_name, result)
+        return result
+
+    return wrapper
+
+
+# MARK: 現在の年
+@_memoize_per_request
+def get_current_year():
+    """
+    現在の年を取得する関数。
 
     Returns:
-        list: 利用可能な年度（降順）のリスト
+        int: 現在の年。リクエスト中は最初に取得した値を使い回す。
+    """
+    return datetime.now().year
+
+
+# MARK: リクエストの言語
+@_memoize_per_request
+def get_request_language():
+    """
+    リクエスト中に使う言語コードを取得する関数。
+
+    Returns:
+        str: 検証済みの言語コード。リクエスト中は最初に検証した値を使い回す。
+
+    Note:
+        セッションの言語は before_request の get_locale で確定するため、
+        それ以降の呼び出しで値が変わることはない。
+    """
+    return get_validated_language(session)
+
+
+# MARK: 年度データ
+@_memoize_per_request
+def get_year_data():
+    """
+    Yearテーブルから全年度の行を取得する関数。
+
+    Returns:
+        list: 各年度の year, categories, ends_at を持つ辞書のリスト
+
+    Note:
+        年度一覧・終了日時・翻訳済URLの年度展開はいずれもこの結果から導くため、
+        Yearテーブルへの問い合わせは1回で済む。
     """
     # ここに書かないと循環インポートになる
     from app.main import flask_cache
 
-    cache_key = "available_years_list"
-    cached_years = flask_cache.get(cache_key)
+    cache_key = "year_data_list"
+    cached_year_data = flask_cache.get(cache_key)
 
-    if cached_years is not None:
-        return cached_years
+    if cached_year_data is not None:
+        return cached_year_data
 
     year_data = supabase_service.get_data(
         table="Year",
-        columns=["year"],
+        columns=["year", "categories", "ends_at"],
     )
-    available_years = [item["year"] for item in year_data]
-    available_years.sort(reverse=True)
 
-    # キャッシュに保存（タイムアウトなし）
-    flask_cache.set(cache_key, available_years)
+    # 取得に失敗すると空リストが返るため、その場合はキャッシュせず次回に再取得する
+    if year_data:
+        # キャッシュに保存（年度は年に1回しか増えないため1時間保持する）
+        flask_cache.set(cache_key, year_data, timeout=HOUR)
+
+    return year_data
+
 
-    return available_years
+# MARK: 年度一覧
+@_memoize_per_request
+def get_available_years():
+    """
+    年度一覧を取得する関数。
+
+    Returns:
+        tuple: 利用可能な年度（降順）のタプル。先頭が最新年度。
+
+    Note:
+        リクエスト内で共有しても書き換えられないよう、不変のタプルで返す。
+    """
+    return tuple(sorted((item["year"] for item in get_year_data()), reverse=True))
+
+
+# MARK: 年度終了日時
+@_memoize_per_request
+def get_year_ends_at():
+    """
+    全年度の終了日時を取得する関数。
+
+    Returns:
+        dict: 年度をキー、終了日時（未定の場合はNone）を値とする辞書
+    """
+    return {item["year"]: item["ends_at"] for item in get_year_data()}
 
 
 # MARK: 翻訳済URL
+@_memoize_per_request
 def get_translated_urls():
     r"""
     英語（en）のmessages.poファイルから、翻訳済みページのURLパス一覧を取得する内部関数。
 
     Returns:
-        set: 翻訳が存在するページのURLパスのセット
+        frozenset: 翻訳が存在するページのURLパスの集合
 
     Note:
         messages.poのmsgidコメント（例: #: .\gbbinfojpn\app\templates\2024\rule.html:3）から
         テンプレートパスを抽出し、URLパスに変換します。
         common/配下のテンプレートは年度ごとに展開されるため、全年度分を生成します。
         base.html, includes, 404.html等は除外します。
+        キャッシュミスが同時に発生しても、生成処理は1スレッドのみが行います。
+        年度データが取得できなかった場合は common/ 配下のURLが欠けるため、キャッシュしません。
     """
     # ここに書かないと循環インポートになる
     from app.main import flask_cache
@@ -74,106 +185,115 @@ def get_translated_urls():
     if cached_urls is not None:
         return cached_urls
 
+    # 起動時のスレッドと初回リクエストが重なっても、生成は1回だけにする
+    with _translated_urls_lock:
+        cached_urls = flask_cache.get(cache_key)
+        if cached_urls is not None:
+            return cached_urls
+
+        year_data = get_year_data()
+        try:
+            translated_urls = _build_translated_urls(year_data)
+        except FileNotFoundError:
+            return frozenset()
+
+        # キャッシュに保存（年度が無いと不完全な結果になるため保存しない）
+        if year_data:
+            flask_cache.set(cache_key, translated_urls, timeout=24 * HOUR)
+
+    return translated_urls
+
+
+def _build_translated_urls(year_data):
+    """
+    messages.poを解析して翻訳済みページのURLパスのセットを生成する。
+
+    Args:
+        year_data (list): get_year_data() で取得した年度データ
+
+    Returns:
+        frozenset: 翻訳が存在するページのURLパスの集合
+
+    Raises:
+        FileNotFoundError: messages.poが存在しない場合
+    """
     po_file_path = (
         BASE_DIR / "app" / "translations" / "en" / "LC_MESSAGES" / "messages.po"
     )
     translated_urls = set()
 
-    try:
-        with open(po_file_path, "r", encoding="utf-8") as f:
-            po_content = f.read()
-    except FileNotFoundError:
-        return set()
+    # 参照コメント行はバイナリのまま1回の走査で取り出し、UTF-8 のデコードもまとめて1回で済ませる
+    with open(po_file_path, "rb") as f:
+        references = b" ".join(_PO_REFERENCE_RE.findall(f.read())).decode("utf-8")
 
-    exclude_patterns = [
-        r"includes/",
-        r"base\.html",
-        r"404\.html",
+    # 年度ごとに展開（カテゴリが未登録の中止年度は除外）
+    available_years = [
+        item["year"] for item in year_data if item["categories"] is not None
     ]
 
-    # 年度ごとに展開（中止年度は除外）
-    year_data = supabase_service.get_data(
-        table="Year",
-        columns=["year"],
-        filters={f"categories__{Operator.IS_NOT}": None},
-        pandas=True,
-    )
-    available_years = year_data["year"].tolist()
+    # テンプレートの参照は言語に依存しないため、先に1回だけ解析する
+    common_templates = set()  # common/foo.html -> foo
+    yearly_templates = set()  # 2024/foo.html -> 2024/foo
+    for template_path in _TEMPLATE_PATH_RE.findall(references):
+        # 除外条件
+        if _EXCLUDE_TEMPLATE_RE.search(template_path):
+            continue
+
+        # 年度ディレクトリ or commonディレクトリ（末尾は必ず ".html"）
+        if template_path.startswith("common/"):
+            common_templates.add(template_path[_COMMON_PREFIX_LEN:_HTML_SUFFIX_START])
+        else:
+            yearly_templates.add(template_path[:_HTML_SUFFIX_START])
 
+    # 言語ごとにURLへ展開する
     for lang in SUPPORTED_LOCALES:
-        for line in po_content.split("\n"):
-            if line.startswith("#: templates/"):
-                # コメント行から複数パスを取得
-                paths = line.replace("#:", "").split()
-                for path in paths:
-                    # 除外条件
-                    if any(re.search(pattern, path) for pattern in exclude_patterns):
-                        continue
-
-                    # パスからテンプレート部分を抽出
-                    m = re.match(r"templates/(.+?\.html)", path)
-                    if not m:
-                        continue
-                    template_path = m.group(1)
-
-                    # 年度ディレクトリ or commonディレクトリ
-                    if template_path.startswith("common/"):
-                        for year in available_years:
-                            # common/foo.html -> /{lang}/{year}/foo
-                            url_path = (
-                                "/"
-                                + lang
-                                + "/"
-                                + str(year)
-                                + "/"
-                                + template_path.replace("common/", "").replace(
-                                    ".html", ""
-                                )
-                            )
-                            translated_urls.add(url_path)
-                    else:
-                        # 2024/foo.html -> /{lang}/2024/foo
-                        url_path = "/" + lang + "/" + template_path.replace(".html", "")
-                        translated_urls.add(url_path)
-
-    # キャッシュに保存
-    flask_cache.set(cache_key, translated_urls, timeout=24 * HOUR)
+        # common/foo.html -> /{lang}/{year}/foo （年度ごとに展開）
+        translated_urls.update(
+            f"/{lang}/{year}/{template}"
+            for year in available_years
+            for template in common_templates
+        )
+        # 2024/foo.html -> /{lang}/2024/foo
+        translated_urls.update(f"/{lang}/{template}" for template in yearly_templates)
 
-    return translated_urls
+    # 生成後は変更しないので、読み取り専用の frozenset にしておく
+    return frozenset(translated_urls)
 
 
 # MARK: 最新年度
-def is_latest_year(year):
+def is_latest_year(year, current_year=None):
     """
     指定された年度が最新年度または今年であるかを判定します。
 
     Args:
         year (int): 判定する年度
+        current_year (int, optional): 現在の年。省略時は現在時刻から取得する。
 
     Returns:
         bool: 最新年度または今年の場合はTrue、それ以外はFalse
     """
-    dt_now = datetime.now()
-    now = dt_now.year
+    if current_year is None:
+        current_year = datetime.now().year
 
     # 現在年度以上の年度は最新年度とみなす
-    return year >= now
+    return year >= current_year
 
 
 # MARK: 試験公開年度
-def is_early_access(year):
+def is_early_access(year, current_year=None):
     """
     指定された年度が、試験公開年度かを判定します。
 
     Args:
         year (int): 判定する年度
+        current_year (int, optional): 現在の年。省略時は現在時刻から取得する。
 
     Returns:
         bool: 試験公開年度の場合はTrue、それ以外はFalse
     """
-    dt_now = datetime.now()
-    now = dt_now.year
-    return year > now
+    if current_year is None:
+        current_year = datetime.now().year
+    return year > current_year
 
 
 # MARK: 翻訳対応可否
@@ -184,7 +304,7 @@ def is_translated(url, language, translated_urls):
     Args:
         url (str): 判定するURL
         language (str): 言語コード（例: 'en', 'ja' など）
-        translated_urls (set): 翻訳済みURLのセット
+        translated_urls (frozenset): 翻訳済みURLの集合
 
     Returns:
         bool: 翻訳されている場合はTrue、そうでない場合はFalse
@@ -211,53 +331,68 @@ def is_gbb_ended(year):
 
     Returns:
         bool: GBB終了年度の場合はTrue、それ以外はFalse
-    """
-    # ここに書かないと循環インポートになる
-    from app.main import flask_cache
-
-    cache_key = f"gbb_ended_{year}"
-    cached_result = flask_cache.get(cache_key)
-
-    if cached_result is not None:
-        return cached_result
 
+    Note:
+        終了日時は全年度分をまとめてキャッシュした get_year_ends_at から引き、現在時刻と毎回比較する。
+        本関数自体は結果をキャッシュしないが、本番環境では common_variables がパスごとに
+        1分間キャッシュするため、ページ上の表示は終了日時を過ぎてから最大1分遅れて切り替わる。
+    """
     # タイムゾーンを考慮した現在時刻を取得
     now = datetime.now(timezone.utc)
 
     # 過去年度は常にTrue
     if year < now.year:
-        flask_cache.set(cache_key, True)
         return True
 
-    # 年度データを取得
-    year_data = supabase_service.get_data(
-        table="Year",
-        columns=["year", "ends_at"],
-        filters={"year": year},
-    )
+    # 全年度の終了日時から取得（年度ごとの問い合わせはしない）
+    ends_at = get_year_ends_at().get(year)
 
-    # データが存在しない場合 (おそらくありえない)
-    if not year_data:
-        flask_cache.set(cache_key, False)
-        return False
-
-    # 終了日時が設定されていない場合 (未定 = まだ始まっていない とみなす)
-    ends_at = year_data[0]["ends_at"]
+    # データが存在しない or 終了日時が設定されていない場合 (未定 = まだ始まっていない とみなす)
     if not ends_at:
-        flask_cache.set(cache_key, False)
         return False
 
-    # 終了日時と現在時刻を比較
-    datetime_ends_at = parser.parse(ends_at)
-    result = datetime_ends_at < now
-    flask_cache.set(cache_key, result)
-    return result
+    # 終了日時と現在時刻を比較（SupabaseはISO 8601で返すため標準ライブラリで解析できる）
+    if isinstance(ends_at, datetime):
+        datetime_ends_at = ends_at
+    else:
+        try:
+            datetime_ends_at = datetime.fromisoformat(ends_at)
+        except ValueError:
+            # ISO 8601 以外の形式が来たときだけ dateutil を読み込む
+            from dateutil import parser
+
+            datetime_ends_at = parser.parse(ends_at)
+    return datetime_ends_at < now
+
+
+# MARK: 最終更新日時
+def get_last_updated(language):
+    """
+    最終更新日時を、指定した言語で整形した文字列として返す。
+
+    Args:
+        language (str): 現在のリクエストの言語コード。
+
+    Returns:
+        str: LAST_UPDATED を "full" 形式で整形した文字列（表示タイムゾーンは BABEL_DEFAULT_TIMEZONE）。
+
+    Note:
+        LAST_UPDATED は定数で、整形結果は言語によってのみ変わるため、言語ごとに保持して使い回す。
+        キャッシュのキーと整形に使うロケールを一致させるため、ロケールは引数の言語を明示的に渡す。
+    """
+    last_updated = _LAST_UPDATED_CACHE.get(language)
+    if last_updated is None:
+        last_updated = format_datetime(
+            LAST_UPDATED, "full", tzinfo=get_timezone(), locale=language
+        )
+        _LAST_UPDATED_CACHE[language] = last_updated
+    return last_updated
 
 
 # MARK: 言語URL
 def get_change_language_url(current_url):
     """
-    現在のURLに対して、各言語ごとにlangクエリパラメータを付与したURLリストを生成します。
+    現在のURLのパスの言語部分を各言語に置き換えたURLリストを生成します。
 
     Args:
         current_url (str): 現在のURL。
@@ -265,21 +400,26 @@ def get_change_language_url(current_url):
     Returns:
         list: 各言語ごとの(url, lang_name)のタプルリスト。
     """
-    change_language_urls = []
-    parsed_url = urlparse(current_url)
+    # スキームとホストを除いた「パス?クエリ」部分だけを文字列操作で取り出す
+    scheme_end = current_url.find("://")
+    path_start = current_url.find("/", scheme_end + 3) if scheme_end != -1 else 0
+    relative_url = current_url[path_start:] if path_start != -1 else ""
+    path, _, query = relative_url.partition("?")
+    query_suffix = f"?{query}" if query else ""
+
     current_language = session.get("language", "")
+    current_prefix = f"/{current_language}/"
 
-    for lang_code, lang_name in LANGUAGE_CHOICES:
-        # path の言語部分を置換して新しいパスを作る
-        new_path = (
-            parsed_url.path.replace(f"/{current_language}/", f"/{lang_code}/")
-            if current_language
-            else parsed_url.path
-        )
-        new_url = urlunparse(
-            ("", "", new_path, parsed_url.params, parsed_url.query, parsed_url.fragment)
-        )
-        change_language_urls.append((new_url, lang_name))
+    # パスに現在の言語が含まれない場合、どの言語でも同じURLになる
+    if not current_language or current_prefix not in path:
+        new_url = path + query_suffix
+        return [(new_url, lang_name) for _, lang_name in _LANGUAGE_PREFIXES]
+
+    # path の言語部分（先頭の1か所のみ）を置換して新しいURLを作る
+    change_language_urls = [
+        (path.replace(current_prefix, lang_prefix, 1) + query_suffix, lang_name)
+        for lang_prefix, lang_name in _LANGUAGE_PREFIXES
+    ]
 
     return change_language_urls
 
@@ -299,7 +439,7 @@ def common_variables(
     Returns:
         dict: テンプレートで利用可能な共通変数の辞書。
             - year (int): 現在の年度
-            - available_years (list): 利用可能な年度リスト
+            - available_years (tuple): 利用可能な年度（降順）
             - change_language_urls (list): 言語ごとのURLと表示名のタプルリスト
             - language (str): 現在の言語コード
             - is_translated (bool): 現在のページが翻訳済みかどうか
@@ -310,30 +450,73 @@ def common_variables(
             - is_local (bool): ローカル環境かどうか
             - is_pull_request (bool): プルリクエスト環境かどうか
             - scroll (str): スクロール位置（クエリパラメータ）
+
+    Note:
+        1リクエスト内で複数回テンプレートを描画しても、計算は初回の1回だけ行い flask.g の結果を返す。
+        本番環境では、パスと言語だけで決まる値を1分間キャッシュする。
+        クエリに依存する値（言語切り替えURL・スクロール位置）と、プロセスごとに決まる最終更新日時は
+        キャッシュせず、毎リクエスト作成する。
+    """
+    common = g.get("_common_variables")
+    if common is not None:
+        return common
+
+    language = get_request_language()
+
+    # ローカル・PR環境では変更をすぐ確認できるよう、キャッシュを使わない
+    if not IS_LOCAL and not IS_PULL_REQUEST:
+        # ここに書かないと循環インポートになる
+        from app.main import flask_cache
+
+        # 広告の計測パラメータなどでキーが分かれないよう、クエリはキーに含めない
+        cache_key = f"common_variables_{language}_{request.path}"
+        path_variables = flask_cache.get(cache_key)
+        if path_variables is None:
+            path_variables = _build_path_variables(language)
+            # 終了判定などが古くなりすぎないよう、キャッシュは短めにする
+            flask_cache.set(cache_key, path_variables, timeout=MINUTE)
+    else:
+        path_variables = _build_path_variables(language)
+
+    g._common_variables = {
+        **path_variables,
+        "change_language_urls": get_change_language_url(request.url),
+        "last_updated": get_last_updated(language),
+        "is_local": IS_LOCAL,
+        "is_pull_request": IS_PULL_REQUEST,
+        "scroll": request.args.get("scroll", ""),
+    }
+    return g._common_variables
+
+
+def _build_path_variables(language):
     """
-    # 年度が最新 or 試験公開年度か検証
-    try:
-        year_str = request.path.split("/")[2]
-        year = int(year_str)
-    except Exception:
-        year = datetime.now().year
+    共通変数のうち、リクエストのパスと言語だけで決まる値を作成する。
+
+    Args:
+        language (str): 現在の言語コード
+
+    Returns:
+        dict: year, available_years, language, is_translated,
+            is_latest_year, is_early_access, is_gbb_ended を持つ辞書
+    """
+    # 現在の年は1リクエストにつき1回だけ取得し、各判定関数で使い回す
+    current_year = get_current_year()
+
+    # 年度が最新 or 試験公開年度か検証（年度を含まないパスは今年として扱う）
+    year_match = _YEAR_SEGMENT_RE.match(request.path)
+    year = int(year_match.group(1)) if year_match else current_year
 
     translated_urls = get_translated_urls()
-    language = get_validated_language(session)
 
     return {
         "year": year,
         "available_years": get_available_years(),
-        "change_language_urls": get_change_language_url(request.url),
         "language": language,
         "is_translated": is_translated(request.path, language, translated_urls),
-        "last_updated": format_datetime(LAST_UPDATED, "full"),
-        "is_latest_year": is_latest_year(year),
-        "is_early_access": is_early_access(year),
+        "is_latest_year": is_latest_year(year, current_year),
+        "is_early_access": is_early_access(year, current_year),
         "is_gbb_ended": is_gbb_ended(year),
-        "is_local": IS_LOCAL,
-        "is_pull_request": IS_PULL_REQUEST,
-        "scroll": request.args.get("scroll", ""),
     }
 
 
@@ -349,9 +532,9 @@ def get_locale():
         セッションに"language"が設定されていない場合は、リクエストのAccept-Languageヘッダーから
         最適なロケールを選択し、セッションに保存します。該当するロケールがない場合は"ja"をデフォルトとします。
     """
-    # URL の最初のパス要素を優先
+    # URL の最初のパス要素を優先（残りのパスは分割しない）
     preferred_language = (
-        request.path.split("/")[1] if request.path.startswith("/") else None
+        request.path[1:].partition("/")[0] if request.path.startswith("/") else None
     )
 
     # URL の言語がサポート済みなら優先
@@ -413,14 +596,17 @@ def add_language_and_redirect():
     """
     現在の URL の先頭に session['language'] を付与してリダイレクトする。
     """
-    parsed_url = urlparse(request.url)
-
-    language = get_validated_language(session)
-
-    new_path = "/" + language + parsed_url.path
-    new_url = urlunparse(
-        ("", "", new_path, parsed_url.params, parsed_url.query, parsed_url.fragment)
-    )
+    language = get_request_language()
+
+    # スキームやホストは捨てるため、URL全体を解析せずにパスとクエリを連結する
+    # （フラグメントはサーバーに送られないので扱わない）
+    # request.path はデコード済みなので、%3F や %23 がクエリ・フラグメントに
+    # 化けないよう再エンコードする
+    path = quote(request.path, safe="/:@!$&'()*+,;=-._~")
+    new_url = f"/{language}{path}"
+    query_string = request.query_string.decode("utf-8", "replace")
+    if query_string:
+        new_url += f"?{query_string}"
     return redirect(new_url)
 
 
@@ -437,37 +623,76 @@ def delete_world_map():
         OSError: ファイルの削除に失敗した場合
     """
     templates_dir = BASE_DIR / "app" / "templates"
-    if templates_dir.is_dir():
-        for html_file in templates_dir.glob("*/world_map/*.html"):
-            html_file.unlink()
+    if not templates_dir.is_dir():
+        return
+
+    with os.scandir(templates_dir) as entries:
+        year_dirs = [entry.path for entry in entries if entry.is_dir()]
+
+    for year_dir in year_dirs:
+        world_map_dir = os.path.join(year_dir, "world_map")
+        for file_name in _list_html_files(world_map_dir):
+            os.remove(os.path.join(world_map_dir, file_name))
+
+
+# MARK: テンプレート一覧
+def _list_html_files(directory):
+    """
+    ディレクトリ直下の .html ファイル名を返す。
+
+    Path.glob はエントリごとに Path を生成するため、os.scandir で名前だけを見る。
+    ディレクトリが存在しない場合は空のタプルを返す（glob と同じ挙動）。
+
+    Args:
+        directory (str | Path): 走査するディレクトリ
+
+    Returns:
+        tuple[str, ...]: .html ファイル名のタプル（走査順）
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return tuple(
+                entry.name
+                for entry in entries
+                if entry.name.endswith(".html") and entry.is_file()
+            )
+    except FileNotFoundError:
+        return ()
+
+
+def _list_template_names(directory):
+    """ディレクトリ直下のテンプレート名（拡張子なし）を返す。"""
+    return tuple(file_name[:-5] for file_name in _list_html_files(directory))
 
 
 # MARK: others
+@lru_cache(maxsize=1)
 def get_others_content():
     """
     'Others'カテゴリに属するコンテンツを取得します。
 
     Returns:
-        list: 'Others'カテゴリに属するコンテンツのリスト
+        tuple: 'Others'カテゴリに属するコンテンツのタプル
+
+    Note:
+        テンプレートはデプロイ後に増減しないため、ディレクトリの走査結果はプロセス内でキャッシュする。
     """
-    file_names = []
-    for html_file in BASE_DIR.glob("app/templates/others/*.html"):
-        file_names.append(html_file.stem)
-    return file_names
+    return _list_template_names(BASE_DIR / "app" / "templates" / "others")
 
 
 # MARK: travel
+@lru_cache(maxsize=1)
 def get_travel_content():
     """
     'Travel'カテゴリに属するコンテンツを取得します。
 
     Returns:
-        list: 'Travel'カテゴリに属するコンテンツのリスト
+        tuple: 'Travel'カテゴリに属するコンテンツのタプル
+
+    Note:
+        テンプレートはデプロイ後に増減しないため、ディレクトリの走査結果はプロセス内でキャッシュする。
     """
-    file_names = []
-    for html_file in BASE_DIR.glob("app/templates/travel/*.html"):
-        file_names.append(html_file.stem)
-    return file_names
+    return _list_template_names(BASE_DIR / "app" / "templates" / "travel")
 
 
 # MARK: 年度別
@@ -475,21 +700,29 @@ def get_yearly_content(AVAILABLE_YEARS):
     """年度ごとのコンテンツ一覧と対応する年度リストを返す。
 
     Args:
-        AVAILABLE_YEARS (list): 対象の年度リスト
+        AVAILABLE_YEARS (tuple): 対象の年度
 
     Returns:
         tuple: (years_list, contents_per_year)
-            - years_list (list[int]): 各コンテンツに対応する年度
-            - contents_per_year (list[str]): 年度別テンプレートのコンテンツ名
+            - years_list (tuple[int]): 各コンテンツに対応する年度
+            - contents_per_year (tuple[str]): 年度別テンプレートのコンテンツ名
     """
+    # キャッシュのキーにするため、ハッシュ可能なタプルに変換する
+    return _list_yearly_content(tuple(AVAILABLE_YEARS))
+
+
+@cache
+def _list_yearly_content(years):
+    """年度ごとのテンプレートを走査し、結果をプロセス内でキャッシュする。"""
     years_list = []
     contents_per_year = []
-    for year in AVAILABLE_YEARS:
-        for html_file in BASE_DIR.glob(f"app/templates/{year}/*.html"):
-            contents_per_year.append(html_file.stem)
-            years_list.append(year)
+    templates_dir = BASE_DIR / "app" / "templates"
+    for year in years:
+        contents = _list_template_names(templates_dir / str(year))
+        contents_per_year.extend(contents)
+        years_list.extend([year] * len(contents))
 
-    return years_list, contents_per_year
+    return tuple(years_list), tuple(contents_per_year)
 
 
 # MARK: 出場者id
@@ -555,18 +788,16 @@ def _build_year_lang_pairs(years):
     """年度×言語の直積を平坦な2リストで返す。
 
     Args:
-        years (list[int]): 年度リスト。
+        years (tuple[int]): 年度のタプル（lru_cache のキーになるためハッシュ可能であること）。
 
     Returns:
         tuple: (year_list, lang_list)
             - year_list (list[int]): 年度を展開したリスト。
             - lang_list (list[str]): 対応する言語コードを展開したリスト。
     """
-    year_list = []
-    lang_list = []
-    for year, lang in product(years, SUPPORTED_LOCALES):
-        year_list.append(year)
-        lang_list.append(lang)
+    # 年度は言語数ぶん各要素を繰り返し（repeat）、言語は年度数ぶん全体を繰り返す（tile）
+    year_list = [year for year in years for _ in SUPPORTED_LOCALES]
+    lang_list = list(SUPPORTED_LOCALES) * len(years)
     return year_list, lang_list
 
 
@@ -574,16 +805,15 @@ def _build_year_lang_pairs(years):
 def _sitemap_general():
     """一般ページ用の年度×言語リストを返す。"""
 
-    years = get_available_years()
-    return _build_year_lang_pairs(tuple(years))
+    return _build_year_lang_pairs(get_available_years())
 
 
 @lru_cache(maxsize=1)
 def _sitemap_result():
     """リザルト用の年度×言語リストを返す（2017年以降）。"""
 
-    years = [y for y in get_available_years() if y >= 2017]
-    return _build_year_lang_pairs(tuple(years))
+    years = tuple(y for y in get_available_years() if y >= 2017)
+    return _build_year_lang_pairs(years)
 
 
 @lru_cache(maxsize=1)
@@ -593,14 +823,12 @@ def _sitemap_participant_detail():
     participant_ids, participant_modes = get_participant_id()
     id_mode_pairs = tuple(sorted(set(zip(participant_ids, participant_modes))))
 
-    lang_list = []
-    id_list = []
-    mode_list = []
-
-    for lang, (participant_id, mode) in product(SUPPORTED_LOCALES, id_mode_pairs):
-        lang_list.append(lang)
-        id_list.append(participant_id)
-        mode_list.append(mode)
+    # 言語ごとに (id, mode) の並びを繰り返すだけなので、append を重ねずに内包表記で作る
+    id_list = [
+        participant_id for _ in SUPPORTED_LOCALES for participant_id, _ in id_mode_pairs
+    ]
+    mode_list = [mode for _ in SUPPORTED_LOCALES for _, mode in id_mode_pairs]
+    lang_list = [lang for lang in SUPPORTED_LOCALES for _ in id_mode_pairs]
 
     return id_list, mode_list, lang_list
 
@@ -608,11 +836,8 @@ def _sitemap_participant_detail():
 def _build_content_lang_pairs(contents):
     """コンテンツ×言語の直積を返す。"""
 
-    lang_list = []
-    content_list = []
-    for lang, content in product(SUPPORTED_LOCALES, contents):
-        lang_list.append(lang)
-        content_list.append(content)
+    content_list = [content for _ in SUPPORTED_LOCALES for content in contents]
+    lang_list = [lang for lang in SUPPORTED_LOCALES for _ in contents]
     return content_list, lang_list
 
 
@@ -620,14 +845,14 @@ def _build_content_lang_pairs(contents):
 def _sitemap_others():
     """others 配下のコンテンツ×言語を返す。"""
 
-    return _build_content_lang_pairs(tuple(get_others_content()))
+    return _build_content_lang_pairs(get_others_content())
 
 
 @lru_cache(maxsize=1)
 def _sitemap_travel():
     """travel 配下のコンテンツ×言語を返す。"""
 
-    return _build_content_lang_pairs(tuple(get_travel_content()))
+    return _build_content_lang_pairs(get_travel_content())
 
 
 @lru_cache(maxsize=1)
@@ -636,16 +861,11 @@ def _sitemap_general_content():
 
     years_list, contents_per_year = get_yearly_content(get_available_years())
 
-    sitemap_years = []
-    sitemap_langs = []
-    sitemap_contents = []
-
-    pair_list = list(zip(years_list, contents_per_year))
-
-    for (year, content), lang in product(pair_list, SUPPORTED_LOCALES):
-        sitemap_years.append(year)
-        sitemap_langs.append(lang)
-        sitemap_contents.append(content)
+    sitemap_years = [year for year in years_list for _ in SUPPORTED_LOCALES]
+    sitemap_langs = [lang for _ in years_list for lang in SUPPORTED_LOCALES]
+    sitemap_contents = [
+        content for content in contents_per_year for _ in SUPPORTED_LOCALES
+    ]
 
     return sitemap_years, sitemap_langs, sitemap_contents
 
@@ -682,28 +902,33 @@ def get_variable(mode):
 # MARK: 初期化タスク
 def initialize_background_tasks(IS_LOCAL):
     """
-    バックグラウンドタスクを初期化して同期的に必要なコンテンツを取得します。
+    アプリケーション起動時のバックグラウンドタスクを開始します。
 
     この関数は以下を行います：
     - IS_LOCAL が True の場合、delete_world_map を別スレッドで起動（非同期、fire-and-forget）。
-    - get_translated_urls を別スレッドで起動（非同期、fire-and-forget）。
-    - get_available_years、get_others_content、get_yearly_content を同期的に呼び出し、その結果を返す。
+    - 翻訳済みURLは、最初のリクエストが生成を待たずに済むよう、ここで同期的に作成する。
+    - 最終更新日時を、対応する全言語分あらかじめ整形しておく。
 
     引数:
         IS_LOCAL (bool): ローカル環境フラグ。True のとき delete_world_map を並列実行する。
 
-    戻り値:
-        tuple:
-            - AVAILABLE_YEARS: get_available_years() の戻り値（利用可能な年一覧など）。
-            - OTHERS_CONTENT: get_others_content() の戻り値（その他共通コンテンツ）。
-            - YEARLY_CONTENT: get_yearly_content(AVAILABLE_YEARS) の戻り値（年度別コンテンツ）。
-
     注意:
-        - 別スレッドで起動されるタスク（delete_world_map, get_translated_urls）は
-          fire-and-forget であり、この関数はそれらの完了を待ちません。
-        - 非同期タスク内で発生した例外はここでは捕捉されません。必要ならタスク内で例外処理を行ってください。
+        - 別スレッドで起動されるタスク（delete_world_map）は fire-and-forget であり、
+          この関数はその完了を待ちません。
+        - flask_cache を使うキャッシュ作成は app.main の読み込み中に別スレッドで行うと
+          インポートロックで待たされ並列にならないため、メインスレッドで行います。
         - 本関数はアプリケーション初期化時に一度だけ呼び出すことを想定しています。
     """
     if IS_LOCAL:
         Thread(target=delete_world_map).start()
-    Thread(target=get_translated_urls).start()
+
+    # 翻訳済みURLはアプリが応答を始める前に作っておく
+    get_translated_urls()
+
+    # ここに書かないと循環インポートになる
+    from app.main import app
+
+    # タイムゾーンの取得にアプリケーションコンテキストが必要
+    with app.app_context():
+        for language in SUPPORTED_LOCALES:
+            get_last_updated(language)
@@ -20,6 +20,25 @@ from app.util.filter_eq import Operator
 load_dotenv()
 
 
+def _make_json_serializable(obj):
+    """キャッシュキー生成用に、値をJSONシリアライズ可能な形へ変換する。
+
+    Args:
+        obj: 変換対象の値。
+
+    Returns:
+        setをソート済みlistに変換した値。dictのキー順は json.dumps(sort_keys=True) で揃うため、ここではソートしない。
+    """
+    if isinstance(obj, dict):
+        return {k: _make_json_serializable(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [_make_json_serializable(v) for v in obj]
+    elif isinstance(obj, set):
+        return sorted(list(obj))
+    else:
+        return obj
+
+
 class SupabaseService:
     """Supabaseとのやり取りを管理するサービスクラス
 
@@ -155,7 +174,7 @@ class SupabaseService:
         キャッシュキーを生成する内部メソッド。
 
         Supabaseからデータを取得する際のクエリ条件（テーブル名、カラム、並び順、JOIN、フィルタなど）をもとに
-        一意なキャッシュキー（MD5ハッシュ）を生成します。
+        一意なキャッシュキー（BLAKE2bハッシュ）を生成します。
 
         Args:
             table (str): 対象テーブル名。
@@ -169,29 +188,23 @@ class SupabaseService:
             str: クエリ条件に基づく一意なキャッシュキー文字列。
         """
 
-        # パラメータを辞書にまとめる
-        def make_json_serializable(obj):
-            if isinstance(obj, dict):
-                return {k: make_json_serializable(obj[k]) for k in sorted(obj)}
-            elif isinstance(obj, list):
-                return [make_json_serializable(v) for v in obj]
-            elif isinstance(obj, set):
-                return sorted(list(obj))
-            else:
-                return obj
-
+        # パラメータを辞書にまとめる（空の条件は変換処理を通さない）
         params = {
             "table": table,
             "columns": sorted(columns) if columns else None,
             "order_by": order_by,
-            "join_tables": make_json_serializable(join_tables),
-            "filters": make_json_serializable(filters),
-            "filters_eq": make_json_serializable(dict(sorted(filters_eq.items()))),
+            "join_tables": (
+                _make_json_serializable(join_tables) if join_tables else None
+            ),
+            "filters": _make_json_serializable(filters) if filters else None,
+            "filters_eq": _make_json_serializable(filters_eq) if filters_eq else {},
         }
 
         # JSON文字列に変換してハッシュ化
         params_str = json.dumps(params, sort_keys=True, ensure_ascii=False)
-        cache_key = hashlib.md5(params_str.encode("utf-8")).hexdigest()
+        cache_key = hashlib.blake2b(
+            params_str.encode("utf-8"), digest_size=16
+        ).hexdigest()
         return f"supabase_data_{cache_key}"
 
     # MARK: get
@@ -1,10 +1,11 @@
 """
 pytest 共通設定。
 
-テストセッション開始時にバックグラウンドタスク（get_translated_urls）の
-スレッド起動を無効化する。これにより、どのテストファイルが先に app.main を
-インポートしても、別スレッドが with を抜けた後の本物の Supabase を参照して
-KeyError になることを防ぐ。
+テストセッション開始時に initialize_background_tasks 全体を無効化する。
+これにより、app.main のインポート時に世界地図の削除スレッドの起動、
+翻訳済みURLの同期作成、最終更新日時の事前整形のいずれも行われない。
+どのテストファイルが先に app.main をインポートしても、モック前の本物の
+Supabase やキャッシュを参照しないよう、各テストで必要な値は個別にモックする。
 """
 # Flask 3 で削除された locked_cached_property の互換（flask-babel が参照する）。
 # Flask 3 では flask.helpers.cached_property も削除されているため werkzeug から取得する。
@@ -5,7 +5,7 @@ python -m pytest app/tests/test_context_processors.py -v
 """
 
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 # Supabaseサービスをモックしてからapp.mainをインポート
 with patch("app.context_processors.supabase_service") as mock_supabase:
@@ -65,11 +65,173 @@ class ContextProcessorsTestCase(unittest.TestCase):
         result = get_available_years()
 
         # 降順でソートされていることを確認（実際の期待値は[2025, 2024, 2023]）
-        self.assertEqual(result, [2025, 2024, 2023])
+        self.assertEqual(result, (2025, 2024, 2023))
 
         # Supabaseが正しいパラメータで呼ばれていることを確認
         mock_supabase.get_data.assert_called_once()
 
+    @patch("app.main.flask_cache")
+    @patch("app.context_processors.supabase_service")
+    def test_get_available_years_caches_with_timeout(
+        self, mock_supabase, mock_flask_cache
+    ):
+        """年度データが1時間のタイムアウト付きでキャッシュされるかのテスト"""
+        from app.config.config import HOUR
+
+        year_data = [{"year": 2024}, {"year": 2025}]
+        mock_flask_cache.get.return_value = None
+        mock_supabase.get_data.return_value = year_data
+
+        result = get_available_years()
+
+        self.assertEqual(result, (2025, 2024))
+        mock_flask_cache.set.assert_called_once_with(
+            "year_data_list", year_data, timeout=HOUR
+        )
+
+        # キャッシュヒット時はSupabaseを呼ばない
+        mock_flask_cache.get.return_value = year_data
+        self.assertEqual(get_available_years(), (2025, 2024))
+        mock_supabase.get_data.assert_called_once()
+
+    @patch("app.main.flask_cache")
+    @patch("app.context_processors.supabase_service")
+    def test_is_gbb_ended_compares_with_current_time(
+        self, mock_supabase, mock_flask_cache
+    ):
+        """今年以降のGBB終了判定は結果をキャッシュせず、終了日時と現在時刻を毎回比較するかのテスト"""
+        from datetime import datetime
+
+        from app.context_processors import is_gbb_ended
+
+        year = datetime.now().year + 1
+        mock_flask_cache.get.return_value = None
+        mock_supabase.get_data.return_value = [
+            {"year": year, "ends_at": "2000-01-01T00:00:00+00:00"},
+            {"year": year + 1, "ends_at": "9999-12-31T00:00:00+00:00"},
+            {"year": year + 2, "ends_at": None},
+        ]
+
+        self.assertTrue(is_gbb_ended(year))
+        self.assertFalse(is_gbb_ended(year + 1))
+        self.assertFalse(is_gbb_ended(year + 2))
+
+        # キャッシュするのは年度データだけ
+        for call in mock_flask_cache.set.call_args_list:
+            self.assertEqual(call.args[0], "year_data_list")
+
+    @patch("app.main.flask_cache")
+    @patch("app.context_processors.supabase_service")
+    def test_is_gbb_ended_past_year_skips_cache(self, mock_supabase, mock_flask_cache):
+        """過去年度はキャッシュもSupabaseも参照せずにTrueを返すかのテスト"""
+        from datetime import datetime
+
+        from app.context_processors import is_gbb_ended
+
+        self.assertTrue(is_gbb_ended(datetime.now().year - 1))
+
+        mock_flask_cache.get.assert_not_called()
+        mock_flask_cache.set.assert_not_called()
+        mock_supabase.get_data.assert_not_called()
+
+    @patch("app.main.flask_cache")
+    @patch("app.context_processors.supabase_service")
+    def test_is_gbb_ended_parses_non_iso_ends_at(self, mock_supabase, mock_flask_cache):
+        """ISO 8601 以外の終了日時でも判定できるかのテスト"""
+        from datetime import datetime
+
+        from app.context_processors import is_gbb_ended
+
+        year = datetime.now().year + 1
+        mock_flask_cache.get.return_value = None
+        mock_supabase.get_data.return_value = [
+            {"year": year, "ends_at": "Sat, 01 Jan 2000 00:00:00 +0000"}
+        ]
+
+        self.assertTrue(is_gbb_ended(year))
+
+    @patch("app.main.flask_cache")
+    @patch("app.context_processors.supabase_service")
+    def test_get_available_years_memoized_per_request(
+        self, mock_supabase, mock_flask_cache
+    ):
+        """同一リクエスト内ではキャッシュサーバーへの問い合わせが1回になるかのテスト"""
+        mock_flask_cache.get.return_value = [{"year": 2025}, {"year": 2024}]
+
+        # 本番と同様に、リクエストごとに新しいアプリケーションコンテキストを使う
+        with app.app_context(), app.test_request_context("/ja/2025/top"):
+            self.assertEqual(get_available_years(), (2025, 2024))
+            self.assertEqual(get_available_years(), (2025, 2024))
+            mock_flask_cache.get.assert_called_once()
+
+        # 別のリクエストでは改めて取得する
+        with app.app_context(), app.test_request_context("/ja/2025/top"):
+            get_available_years()
+        self.assertEqual(mock_flask_cache.get.call_count, 2)
+        mock_supabase.get_data.assert_not_called()
+
+    def test_get_change_language_url(self):
+        """言語切り替えURLが先頭の言語部分だけを置換するかのテスト"""
+        from flask import session
+
+        from app.config.config import LANGUAGE_CHOICES
+        from app.context_processors import get_change_language_url
+
+        with app.test_request_context("/en/2025/rule"):
+            session["language"] = "en"
+            result = get_change_language_url(
+                "http://localhost/en/2025/others/en/?scroll=top"
+            )
+
+        self.assertEqual(
+            result,
+            [
+                (f"/{code}/2025/others/en/?scroll=top", name)
+                for code, name in LANGUAGE_CHOICES
+            ],
+        )
+
+    def test_get_change_language_url_without_language_prefix(self):
+        """パスに現在の言語が含まれない場合は全言語で同じURLを返すかのテスト"""
+        from flask import session
+
+        from app.config.config import LANGUAGE_CHOICES
+        from app.context_processors import get_change_language_url
+
+        with app.test_request_context("/"):
+            session["language"] = "en"
+            result = get_change_language_url("http://localhost/?scroll=top")
+
+        self.assertEqual(
+            result, [("/?scroll=top", name) for _, name in LANGUAGE_CHOICES]
+        )
+
+    def test_get_current_year_memoized_per_request(self):
+        """現在の年がリクエスト内で1回だけ取得されるかのテスト"""
+        from app.context_processors import get_current_year
+
+        with patch("app.context_processors.datetime") as mock_datetime:
+            mock_datetime.now.return_value.year = 2025
+
+            with app.app_context(), app.test_request_context("/ja/2025/top"):
+                self.assertEqual(get_current_year(), 2025)
+                self.assertEqual(get_current_year(), 2025)
+
+            mock_datetime.now.assert_called_once()
+
+    def test_get_request_language_memoized_per_request(self):
+        """言語コードの検証がリクエスト内で1回だけ行われるかのテスト"""
+        from app.context_processors import get_request_language
+
+        with patch(
+            "app.context_processors.get_validated_language", return_value="en"
+        ) as mock_validate:
+            with app.app_context(), app.test_request_context("/en/2025/top"):
+                self.assertEqual(get_request_language(), "en")
+                self.assertEqual(get_request_language(), "en")
+
+            mock_validate.assert_called_once()
+
     def test_is_latest_year(self):
         """最新年度判定のテスト"""
         with patch("app.context_processors.get_available_years") as mock_get_years:
@@ -97,6 +259,135 @@ class ContextProcessorsTestCase(unittest.TestCase):
             # 過去年度は早期アクセスではない
             self.assertFalse(is_early_access(2024))
 
+    def test_year_checks_use_given_current_year(self):
+        """現在の年を渡した場合はdatetime.nowを呼ばないかのテスト"""
+        with patch("app.context_processors.datetime") as mock_datetime:
+            self.assertTrue(is_latest_year(2025, 2025))
+            self.assertFalse(is_latest_year(2024, 2025))
+            self.assertTrue(is_early_access(2026, 2025))
+            self.assertFalse(is_early_access(2025, 2025))
+
+            mock_datetime.now.assert_not_called()
+
+    def test_common_variables_memoized_per_request(self):
+        """同一リクエスト内では共通変数の計算が1回になるかのテスト"""
+        from app.context_processors import common_variables
+
+        with (
+            patch(
+                "app.context_processors.get_translated_urls", return_value=frozenset()
+            ) as mock_urls,
+            patch("app.context_processors.get_available_years", return_value=[2025]),
+            patch("app.context_processors.is_gbb_ended", return_value=False),
+        ):
+            # 本番と同様に、リクエストごとに新しいアプリケーションコンテキストを使う
+            with app.app_context(), app.test_request_context("/ja/2025/top"):
+                first = common_variables(IS_LOCAL=False, IS_PULL_REQUEST=False)
+                second = common_variables(IS_LOCAL=False, IS_PULL_REQUEST=False)
+
+            self.assertIs(first, second)
+            self.assertEqual(first["year"], 2025)
+            mock_urls.assert_called_once()
+
+            # 別のリクエストでは改めて計算する
+            with app.app_context(), app.test_request_context("/ja/2024/top"):
+                third = common_variables(IS_LOCAL=False, IS_PULL_REQUEST=False)
+
+            self.assertEqual(third["year"], 2024)
+            self.assertEqual(mock_urls.call_count, 2)
+
+    @patch("app.main.flask_cache")
+    def test_common_variables_cached_in_production(self, mock_flask_cache):
+        """本番環境では共通変数をキャッシュし、ローカル・PR環境では使わないかのテスト"""
+        from app.config.config import MINUTE
+        from app.context_processors import common_variables
+
+        cached = {"year": 2024}
+        mock_flask_cache.get.return_value = cached
+
+        with patch("app.context_processors.get_translated_urls") as mock_urls:
+            # キャッシュヒット時はパス依存の値を計算せず、クエリ依存の値だけ作成する
+            with (
+                app.app_context(),
+                app.test_request_context("/ja/2025/top?scroll=a&utm_source=x"),
+            ):
+                result = common_variables(IS_LOCAL=False, IS_PULL_REQUEST=False)
+            self.assertEqual(result["year"], 2024)
+            self.assertEqual(result["scroll"], "a")
+            self.assertIn("change_language_urls", result)
+            mock_flask_cache.get.assert_called_once_with(
+                "common_variables_ja_/ja/2025/top"
+            )
+            mock_urls.assert_not_called()
+
+        mock_flask_cache.get.return_value = None
+        mock_flask_cache.get.reset_mock()
+        with (
+            patch(
+                "app.context_processors.get_translated_urls", return_value=frozenset()
+            ),
+            patch("app.context_processors.get_available_years", return_value=[2025]),
+            patch("app.context_processors.is_gbb_ended", return_value=False),
+        ):
+            # キャッシュミス時はパス依存の値だけを1分間保存する
+            with app.app_context(), app.test_request_context("/ja/2025/top?scroll=b"):
+                result = common_variables(IS_LOCAL=False, IS_PULL_REQUEST=False)
+            key, saved = mock_flask_cache.set.call_args.args
+            self.assertEqual(key, "common_variables_ja_/ja/2025/top")
+            self.assertEqual(mock_flask_cache.set.call_args.kwargs, {"timeout": MINUTE})
+            self.assertEqual(saved["year"], 2025)
+            self.assertNotIn("scroll", saved)
+            self.assertNotIn("change_language_urls", saved)
+            # 最終更新日時は他プロセスの起動時刻を共有しないよう、キャッシュに含めない
+            self.assertNotIn("last_updated", saved)
+            self.assertIn("last_updated", result)
+            self.assertEqual(result["scroll"], "b")
+
+            # ローカル・PR環境ではキャッシュを参照も保存もしない
+            mock_flask_cache.reset_mock()
+            for is_local, is_pull_request in ((True, False), (False, True)):
+                with app.app_context(), app.test_request_context("/ja/2025/top"):
+                    common_variables(IS_LOCAL=is_local, IS_PULL_REQUEST=is_pull_request)
+            mock_flask_cache.get.assert_not_called()
+            mock_flask_cache.set.assert_not_called()
+
+    def test_parse_last_updated_env(self):
+        """環境変数 LAST_UPDATED のオフセット無し日時を日本時間とみなすかのテスト"""
+        from datetime import datetime, timedelta, timezone
+
+        from app.config.config import JST, _parse_last_updated
+
+        self.assertEqual(
+            _parse_last_updated("2025-06-01T12:00:00"),
+            datetime(2025, 6, 1, 12, tzinfo=JST),
+        )
+        # オフセット付きの値はそのまま使う
+        self.assertEqual(
+            _parse_last_updated("2025-06-01T12:00:00+00:00"),
+            datetime(2025, 6, 1, 12, tzinfo=timezone.utc),
+        )
+        # 未設定の場合は現在時刻（日本時間）
+        self.assertEqual(_parse_last_updated(None).utcoffset(), timedelta(hours=9))
+
+    def test_get_last_updated_cached_per_language(self):
+        """最終更新日時の整形は言語ごとに1回だけ行われるかのテスト"""
+        from app.context_processors import get_last_updated
+
+        with (
+            patch.dict("app.context_processors._LAST_UPDATED_CACHE", clear=True),
+            patch(
+                "app.context_processors.format_datetime",
+                side_effect=["formatted-ja", "formatted-en"],
+            ) as mock_format,
+        ):
+            self.assertEqual(get_last_updated("ja"), "formatted-ja")
+            self.assertEqual(get_last_updated("ja"), "formatted-ja")
+            self.assertEqual(get_last_updated("en"), "formatted-en")
+
+            self.assertEqual(mock_format.call_count, 2)
+            # ロケールはリクエストの言語を明示的に渡す
+            self.assertEqual(mock_format.call_args.kwargs["locale"], "en")
+
     def test_is_translated(self):
         """翻訳判定のテスト"""
         # 日本語は常にTrue
@@ -107,95 +398,119 @@ class ContextProcessorsTestCase(unittest.TestCase):
         self.assertTrue(is_translated("/test", "en", translated_urls))
         self.assertFalse(is_translated("/not-translated", "en", translated_urls))
 
-    @patch("app.context_processors.BASE_DIR")
-    def test_get_others_content(self, mock_base_dir):
-        """'Others'カテゴリのコンテンツ取得テスト"""
+    def _make_templates_dir(self, files):
+        """一時ディレクトリに app/templates 配下のファイルを作り、BASE_DIR を差し替える"""
+        import tempfile
         from pathlib import Path
 
-        from app.context_processors import get_others_content
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        base_dir = Path(tmp_dir.name)
+        for relative_path in files:
+            path = base_dir / "app" / "templates" / relative_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.touch()
 
-        # モックのPathオブジェクトを作成
-        mock_path = MagicMock(spec=Path)
-        mock_base_dir.__truediv__ = MagicMock(return_value=mock_path)
+        base_dir_patch = patch("app.context_processors.BASE_DIR", base_dir)
+        base_dir_patch.start()
+        self.addCleanup(base_dir_patch.stop)
+        return base_dir
 
-        # globの結果をモック（stemで.htmlを除いたファイル名を返す）
-        mock_file1 = MagicMock()
-        mock_file1.stem = "about"
-        mock_file2 = MagicMock()
-        mock_file2.stem = "contact"
-        mock_file3 = MagicMock()
-        mock_file3.stem = "faq"
+    def test_get_others_content(self):
+        """'Others'カテゴリのコンテンツ取得テスト"""
+        from app.context_processors import get_others_content
 
-        mock_base_dir.glob.return_value = [mock_file1, mock_file2, mock_file3]
+        # 走査結果はプロセス内でキャッシュされるため、前後でクリアする
+        get_others_content.cache_clear()
+        self.addCleanup(get_others_content.cache_clear)
+
+        base_dir = self._make_templates_dir(
+            ["others/about.html", "others/contact.html", "others/faq.html"]
+        )
+        # .html 以外のファイルとディレクトリは対象外
+        (base_dir / "app" / "templates" / "others" / "memo.txt").touch()
+        (base_dir / "app" / "templates" / "others" / "dir.html").mkdir()
 
         result = get_others_content()
 
-        # 結果の確認
-        self.assertEqual(result, ["about", "contact", "faq"])
-        mock_base_dir.glob.assert_called_once_with("app/templates/others/*.html")
+        # 結果の確認（走査順はファイルシステム依存）
+        self.assertIsInstance(result, tuple)
+        self.assertCountEqual(result, ["about", "contact", "faq"])
 
-    @patch("app.context_processors.BASE_DIR")
-    def test_get_travel_content(self, mock_base_dir):
-        """'Travel'カテゴリのコンテンツ取得テスト"""
-        from pathlib import Path
+        # 2回目はディレクトリを走査しない
+        with patch("app.context_processors.os.scandir") as mock_scandir:
+            self.assertCountEqual(get_others_content(), ["about", "contact", "faq"])
+            mock_scandir.assert_not_called()
 
+    def test_get_travel_content(self):
+        """'Travel'カテゴリのコンテンツ取得テスト"""
         from app.context_processors import get_travel_content
 
-        # モックのPathオブジェクトを作成
-        mock_path = MagicMock(spec=Path)
-        mock_base_dir.__truediv__ = MagicMock(return_value=mock_path)
+        # 走査結果はプロセス内でキャッシュされるため、前後でクリアする
+        get_travel_content.cache_clear()
+        self.addCleanup(get_travel_content.cache_clear)
 
-        # globの結果をモック
-        mock_file1 = MagicMock()
-        mock_file1.stem = "hotel"
-        mock_file2 = MagicMock()
-        mock_file2.stem = "transportation"
-
-        mock_base_dir.glob.return_value = [mock_file1, mock_file2]
+        self._make_templates_dir(["travel/hotel.html", "travel/transportation.html"])
 
         result = get_travel_content()
 
         # 結果の確認
-        self.assertEqual(result, ["hotel", "transportation"])
-        mock_base_dir.glob.assert_called_once_with("app/templates/travel/*.html")
+        self.assertCountEqual(result, ["hotel", "transportation"])
 
-    @patch("app.context_processors.BASE_DIR")
-    def test_get_yearly_content(self, mock_base_dir):
-        """年度別コンテンツ取得テスト"""
-        from pathlib import Path
+    def test_get_travel_content_without_directory(self):
+        """ディレクトリが無い場合は空になるかのテスト"""
+        from app.context_processors import get_travel_content
 
-        from app.context_processors import get_yearly_content
+        get_travel_content.cache_clear()
+        self.addCleanup(get_travel_content.cache_clear)
 
-        # モックのPathオブジェクトを作成
-        mock_path = MagicMock(spec=Path)
-        mock_base_dir.__truediv__ = MagicMock(return_value=mock_path)
+        self._make_templates_dir([])
 
-        # 2024年のファイル
-        mock_file_2024_1 = MagicMock()
-        mock_file_2024_1.stem = "top"
-        mock_file_2024_2 = MagicMock()
-        mock_file_2024_2.stem = "rule"
+        self.assertEqual(get_travel_content(), ())
 
-        # 2023年のファイル
-        mock_file_2023_1 = MagicMock()
-        mock_file_2023_1.stem = "top"
+    def test_get_yearly_content(self):
+        """年度別コンテンツ取得テスト"""
+        from app.context_processors import _list_yearly_content, get_yearly_content
 
-        # globの呼び出しごとに異なる結果を返す
-        def glob_side_effect(pattern):
-            if "2024" in pattern:
-                return [mock_file_2024_1, mock_file_2024_2]
-            elif "2023" in pattern:
-                return [mock_file_2023_1]
-            return []
+        # 走査結果はプロセス内でキャッシュされるため、前後でクリアする
+        _list_yearly_content.cache_clear()
+        self.addCleanup(_list_yearly_content.cache_clear)
 
-        mock_base_dir.glob.side_effect = glob_side_effect
+        self._make_templates_dir(["2024/top.html", "2024/rule.html", "2023/top.html"])
 
         available_years = [2024, 2023]
         years_list, contents_per_year = get_yearly_content(available_years)
 
-        # 結果の確認
-        self.assertEqual(years_list, [2024, 2024, 2023])
-        self.assertEqual(contents_per_year, ["top", "rule", "top"])
+        # 結果の確認（年度の順序は引数の順、年度内の順序はファイルシステム依存）
+        self.assertEqual(years_list, (2024, 2024, 2023))
+        self.assertCountEqual(contents_per_year[:2], ["top", "rule"])
+        self.assertEqual(contents_per_year[2], "top")
+
+        # 同じ年度リストなら2回目はディレクトリを走査しない
+        with patch("app.context_processors.os.scandir") as mock_scandir:
+            get_yearly_content(available_years)
+            mock_scandir.assert_not_called()
+
+    def test_delete_world_map(self):
+        """world_map 配下のHTMLだけが削除されるかのテスト"""
+        from app.context_processors import delete_world_map
+
+        base_dir = self._make_templates_dir(
+            [
+                "2024/top.html",
+                "2024/world_map/ja_1.html",
+                "2025/world_map/en_2.html",
+                "2025/world_map/keep.txt",
+            ]
+        )
+        templates_dir = base_dir / "app" / "templates"
+
+        delete_world_map()
+
+        self.assertTrue((templates_dir / "2024" / "top.html").exists())
+        self.assertFalse((templates_dir / "2024" / "world_map" / "ja_1.html").exists())
+        self.assertFalse((templates_dir / "2025" / "world_map" / "en_2.html").exists())
+        self.assertTrue((templates_dir / "2025" / "world_map" / "keep.txt").exists())
 
     @patch("app.main.flask_cache")
     @patch("app.context_processors.supabase_service")
@@ -305,3 +620,130 @@ class ContextProcessorsTestCase(unittest.TestCase):
         # 結果の確認: iso_code=0の参加者は除外されている
         self.assertEqual(participants_id_list, [1, 2, 101])
         self.assertEqual(participants_mode_list, ["single", "team", "team_member"])
+
+    @patch(
+        "app.context_processors.get_year_data",
+        return_value=[{"year": 2025, "categories": [1], "ends_at": None}],
+    )
+    @patch("app.context_processors._build_translated_urls")
+    @patch("app.main.flask_cache")
+    def test_get_translated_urls_builds_once_on_concurrent_miss(
+        self, mock_flask_cache, mock_build, _
+    ):
+        """キャッシュミスが同時に発生しても翻訳済URLの生成が1回だけであることを確認"""
+        import threading
+        import time
+
+        from app.context_processors import get_translated_urls
+
+        # dictを使った簡易キャッシュ
+        store = {}
+        mock_flask_cache.get.side_effect = store.get
+        mock_flask_cache.set.side_effect = lambda key, value, timeout=None: (
+            store.__setitem__(key, value)
+        )
+
+        def slow_build(year_data):
+            time.sleep(0.05)
+            return {"/en/2025/rule"}
+
+        mock_build.side_effect = slow_build
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(get_translated_urls()))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(mock_build.call_count, 1)
+        self.assertEqual(results, [{"/en/2025/rule"}] * 5)
+
+    @patch("app.context_processors.get_year_data", return_value=[])
+    @patch(
+        "app.context_processors._build_translated_urls",
+        side_effect=FileNotFoundError,
+    )
+    @patch("app.main.flask_cache")
+    def test_get_translated_urls_without_po_file(self, mock_flask_cache, *_):
+        """messages.po が無い場合は空の frozenset を返し、キャッシュしないことを確認"""
+        from app.context_processors import get_translated_urls
+
+        mock_flask_cache.get.return_value = None
+
+        result = get_translated_urls()
+
+        self.assertEqual(result, frozenset())
+        self.assertIsInstance(result, frozenset)
+        mock_flask_cache.set.assert_not_called()
+
+    def test_build_translated_urls_from_po_file(self):
+        """messages.po の参照コメントから翻訳済URLの集合を正しく生成するかのテスト"""
+        from app.context_processors import _build_translated_urls
+
+        base_dir = self._make_templates_dir([])
+        po_dir = base_dir / "app" / "translations" / "en" / "LC_MESSAGES"
+        po_dir.mkdir(parents=True)
+        (po_dir / "messages.po").write_text(
+            "\n".join(
+                [
+                    'msgid ""',
+                    'msgstr ""',
+                    "",
+                    # 1行に複数の参照パスがある行
+                    "#: templates/2024/rule.html:3 templates/2025/stream.html:10",
+                    "#: templates/includes/header.html:5 templates/base.html:1",
+                    "#: templates/404.html:2",
+                    "#: templates/common/top.html:7",
+                    'msgid "ルール"',
+                    'msgstr "Rules"',
+                    "",
+                ]
+            ),
+            encoding="utf-8",
+        )
+        year_data = [
+            {"year": 2025, "categories": [1], "ends_at": None},
+            {"year": 2024, "categories": [1], "ends_at": None},
+            # カテゴリ未登録（中止）の年度は common/ を展開しない
+            {"year": 2020, "categories": None, "ends_at": None},
+        ]
+
+        with patch("app.context_processors.SUPPORTED_LOCALES", ("ja", "en")):
+            result = _build_translated_urls(year_data)
+
+        self.assertEqual(
+            result,
+            frozenset(
+                {
+                    "/ja/2024/rule",
+                    "/ja/2025/stream",
+                    "/ja/2025/top",
+                    "/ja/2024/top",
+                    "/en/2024/rule",
+                    "/en/2025/stream",
+                    "/en/2025/top",
+                    "/en/2024/top",
+                }
+            ),
+        )
+
+    @patch("app.context_processors.supabase_service")
+    @patch("app.main.flask_cache")
+    def test_year_data_fetch_failure_is_not_cached(
+        self, mock_flask_cache, mock_supabase
+    ):
+        """年度データの取得に失敗した場合、年度データも翻訳済URLもキャッシュしないことを確認"""
+        from app.context_processors import get_translated_urls, get_year_data
+
+        mock_flask_cache.get.return_value = None
+        # 取得失敗時、get_data は空リストを返す
+        mock_supabase.get_data.return_value = []
+
+        self.assertEqual(get_year_data(), [])
+        get_translated_urls()
+
+        mock_flask_cache.set.assert_not_called()
@@ -36,6 +36,28 @@ class LanguageRedirectTestCase(unittest.TestCase):
         loc = resp.headers.get("Location", "")
         self.assertIn("/ja/participant_detail/1/single", loc)
 
+    def test_redirect_keeps_query_string(self):
+        """リダイレクト先にクエリパラメータがそのまま引き継がれる"""
+        resp = self.client.get(
+            f"/{self.year}/participants?scroll=a%20b", follow_redirects=False
+        )
+        self.assertIn(resp.status_code, (301, 302))
+        loc = resp.headers.get("Location", "")
+        self.assertTrue(
+            loc.endswith(f"/ja/{self.year}/participants?scroll=a%20b"), msg=loc
+        )
+
+    def test_redirect_keeps_encoded_path_characters(self):
+        """パス中のエンコード済み ? や # がクエリ・フラグメントに化けない"""
+        for encoded in ("foo%3Fbar", "foo%23bar"):
+            with self.subTest(encoded=encoded):
+                resp = self.client.get(
+                    f"/{self.year}/{encoded}", follow_redirects=False
+                )
+                self.assertIn(resp.status_code, (301, 302))
+                loc = resp.headers.get("Location", "")
+                self.assertTrue(loc.endswith(f"/ja/{self.year}/{encoded}"), msg=loc)
+
     def test_invalid_session_language_redirects_for_various_paths(self):
         """セッションに不適切な言語コードが入っている場合、代表的なパスですべて日本語にリダイレクトされることを検証する"""
         # 不適切な言語をセット
@@ -8,8 +8,6 @@ import unittest
 from datetime import datetime
 from unittest.mock import patch
 
-import pandas as pd
-
 # Supabaseサービスをモックしてからapp.mainをインポート
 with patch("app.context_processors.supabase_service") as mock_supabase:
     # get_available_years()とget_participant_id()のためのモックデータ
@@ -58,17 +56,14 @@ class TestParticipantDetailWithIsoCodeZero(unittest.TestCase):
 
         # context_processors用のモック設定
         def mock_get_data(**kwargs):
-            # pandas=Trueが指定されている場合はpandas DataFrameを返す
-            if kwargs.get("pandas", False):
-                return pd.DataFrame(
-                    [{"year": 2025, "ends_at": "2025-12-31T23:59:59+00:00"}]
-                )
-            # filtersが指定されている場合はYearテーブルからのデータとして扱う
-            elif "filters" in kwargs:
-                return [{"year": 2025, "ends_at": "2025-12-31T23:59:59+00:00"}]
-            # それ以外の場合はget_available_years()用のリストを返す
-            else:
-                return [{"year": 2025}]
+            # Yearテーブルは全年度分を1回で取得する
+            return [
+                {
+                    "year": 2025,
+                    "categories": [1],
+                    "ends_at": "2025-12-31T23:59:59+00:00",
+                }
+            ]
 
         mock_context_supabase.get_data.side_effect = mock_get_data
 
@@ -107,17 +102,14 @@ class TestParticipantDetailWithIsoCodeZero(unittest.TestCase):
 
         # context_processors用のモック設定
         def mock_get_data(**kwargs):
-            # pandas=Trueが指定されている場合はpandas DataFrameを返す
-            if kwargs.get("pandas", False):
-                return pd.DataFrame(
-                    [{"year": 2025, "ends_at": "2025-12-31T23:59:59+00:00"}]
-                )
-            # filtersが指定されている場合はYearテーブルからのデータとして扱う
-            elif "filters" in kwargs:
-                return [{"year": 2025, "ends_at": "2025-12-31T23:59:59+00:00"}]
-            # それ以外の場合はget_available_years()用のリストを返す
-            else:
-                return [{"year": 2025}]
+            # Yearテーブルは全年度分を1回で取得する
+            return [
+                {
+                    "year": 2025,
+                    "categories": [1],
+                    "ends_at": "2025-12-31T23:59:59+00:00",
+                }
+            ]
 
         mock_context_supabase.get_data.side_effect = mock_get_data
 
@@ -158,17 +150,14 @@ class TestParticipantDetailWithIsoCodeZero(unittest.TestCase):
 
         # context_processors用のモック設定
         def mock_get_data(**kwargs):
-            # pandas=Trueが指定されている場合はpandas DataFrameを返す
-            if kwargs.get("pandas", False):
-                return pd.DataFrame(
-                    [{"year": 2025, "ends_at": "2025-12-31T23:59:59+00:00"}]
-                )
-            # filtersが指定されている場合はYearテーブルからのデータとして扱う
-            elif "filters" in kwargs:
-                return [{"year": 2025, "ends_at": "2025-12-31T23:59:59+00:00"}]
-            # それ以外の場合はget_available_years()用のリストを返す
-            else:
-                return [{"year": 2025}]
+            # Yearテーブルは全年度分を1回で取得する
+            return [
+                {
+                    "year": 2025,
+                    "categories": [1],
+                    "ends_at": "2025-12-31T23:59:59+00:00",
+                }
+            ]
 
         mock_context_supabase.get_data.side_effect = mock_get_data
 
@@ -214,17 +203,14 @@ class TestParticipantDetailWithIsoCodeZero(unittest.TestCase):
 
         # context_processors用のモック設定
         def mock_get_data(**kwargs):
-            # pandas=Trueが指定されている場合はpandas DataFrameを返す
-            if kwargs.get("pandas", False):
-                return pd.DataFrame(
-                    [{"year": 2025, "ends_at": "2025-12-31T23:59:59+00:00"}]
-                )
-            # filtersが指定されている場合はYearテーブルからのデータとして扱う
-            elif "filters" in kwargs:
-                return [{"year": 2025, "ends_at": "2025-12-31T23:59:59+00:00"}]
-            # それ以外の場合はget_available_years()用のリストを返す
-            else:
-                return [{"year": 2025}]
+            # Yearテーブルは全年度分を1回で取得する
+            return [
+                {
+                    "year": 2025,
+                    "categories": [1],
+                    "ends_at": "2025-12-31T23:59:59+00:00",
+                }
+            ]
 
         mock_context_supabase.get_data.side_effect = mock_get_data
 
@@ -335,17 +321,14 @@ class TestParticipantDetailWithIsoCodeZero(unittest.TestCase):
 
         # context_processors用のモック設定
         def mock_get_data(**kwargs):
-            # pandas=Trueが指定されている場合はpandas DataFrameを返す
-            if kwargs.get("pandas", False):
-                return pd.DataFrame(
-                    [{"year": 2025, "ends_at": "2025-12-31T23:59:59+00:00"}]
-                )
-            # filtersが指定されている場合はYearテーブルからのデータとして扱う
-            elif "filters" in kwargs:
-                return [{"year": 2025, "ends_at": "2025-12-31T23:59:59+00:00"}]
-            # それ以外の場合はget_available_years()用のリストを返す
-            else:
-                return [{"year": 2025}]
+            # Yearテーブルは全年度分を1回で取得する
+            return [
+                {
+                    "year": 2025,
+                    "categories": [1],
+                    "ends_at": "2025-12-31T23:59:59+00:00",
+                }
+            ]
 
         mock_context_supabase.get_data.side_effect = mock_get_data
 
@@ -434,17 +417,14 @@ class TestParticipantDetailWithIsoCodeZero(unittest.TestCase):
 
         # context_processors用のモック設定
         def mock_get_data(**kwargs):
-            # pandas=Trueが指定されている場合はpandas DataFrameを返す
-            if kwargs.get("pandas", False):
-                return pd.DataFrame(
-                    [{"year": 2025, "ends_at": "2025-12-31T23:59:59+00:00"}]
-                )
-            # filtersが指定されている場合はYearテーブルからのデータとして扱う
-            elif "filters" in kwargs:
-                return [{"year": 2025, "ends_at": "2025-12-31T23:59:59+00:00"}]
-            # それ以外の場合はget_available_years()用のリストを返す
-            else:
-                return [{"year": 2025}]
+            # Yearテーブルは全年度分を1回で取得する
+            return [
+                {
+                    "year": 2025,
+                    "categories": [1],
+                    "ends_at": "2025-12-31T23:59:59+00:00",
+                }
+            ]
 
         mock_context_supabase.get_data.side_effect = mock_get_data
 
@@ -479,17 +459,14 @@ class TestParticipantDetailWithIsoCodeZero(unittest.TestCase):
 
         # context_processors用のモック設定
         def mock_get_data(**kwargs):
-            # pandas=Trueが指定されている場合はpandas DataFrameを返す
-            if kwargs.get("pandas", False):
-                return pd.DataFrame(
-                    [{"year": 2025, "ends_at": "2025-12-31T23:59:59+00:00"}]
-                )
-            # filtersが指定されている場合はYearテーブルからのデータとして扱う
-            elif "filters" in kwargs:
-                return [{"year": 2025, "ends_at": "2025-12-31T23:59:59+00:00"}]
-            # それ以外の場合はget_available_years()用のリストを返す
-            else:
-                return [{"year": 2025}]
+            # Yearテーブルは全年度分を1回で取得する
+            return [
+                {
+                    "year": 2025,
+                    "categories": [1],
+                    "ends_at": "2025-12-31T23:59:59+00:00",
+                }
+            ]
 
         mock_context_supabase.get_data.side_effect = mock_get_data
 
@@ -114,33 +114,21 @@ class AppUrlsTestCase(unittest.TestCase):
 
         # context_processors内のSupabase呼び出しモック
         def context_get_data_side_effect(*args, **kwargs):
-            table = kwargs.get("table")
-            pandas_flag = kwargs.get("pandas", False)
-            if table == "Year" and pandas_flag:
-                import pandas as pd
-
-                return pd.DataFrame(
-                    [
-                        {"year": 2025},
-                        {"year": 2024},
-                        {"year": 2023},
-                    ]
-                )
-            # 他の場合はデフォルトのリストを返す
+            # Yearテーブルは全年度分を1回で取得する
             return [
                 {
                     "year": 2025,
-                    "categories__is_not": None,
+                    "categories": [1, 2],
                     "ends_at": "2025-12-31T23:59:59Z",
                 },
                 {
                     "year": 2024,
-                    "categories__is_not": None,
+                    "categories": [1, 2],
                     "ends_at": "2024-12-31T23:59:59Z",
                 },
                 {
                     "year": 2023,
-                    "categories__is_not": None,
+                    "categories": [1, 2],
                     "ends_at": "2023-12-31T23:59:59Z",
                 },
             ]
@@ -476,33 +464,21 @@ class AppUrlsTestCase(unittest.TestCase):
 
         # context_processors内のSupabase呼び出しモック
         def context_get_data_side_effect(*args, **kwargs):
-            table = kwargs.get("table")
-            pandas_flag = kwargs.get("pandas", False)
-            if table == "Year" and pandas_flag:
-                import pandas as pd
-
-                return pd.DataFrame(
-                    [
-                        {"year": year},
-                        {"year": year - 1},
-                        {"year": year - 2},
-                    ]
-                )
-            # 他の場合はデフォルトのリストを返す
+            # Yearテーブルは全年度分を1回で取得する
             return [
                 {
                     "year": year,
-                    "categories__is_not": None,
+                    "categories": [1, 2],
                     "ends_at": f"{year}-12-31T23:59:59Z",
                 },
                 {
                     "year": year - 1,
-                    "categories__is_not": None,
+                    "categories": [1, 2],
                     "ends_at": f"{year - 1}-12-31T23:59:59Z",
                 },
                 {
                     "year": year - 2,
-                    "categories__is_not": None,
+                    "categories": [1, 2],
                     "ends_at": f"{year - 2}-12-31T23:59:59Z",
                 },
             ]
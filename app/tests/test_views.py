@@ -260,13 +260,13 @@ class ViewsTestCase(unittest.TestCase):
         # context_processorsのsupabase_serviceもモック（get_translated_urls用）
         def mock_context_get_data_side_effect(*args, **kwargs):
             table = kwargs.get("table")
-            pandas_flag = kwargs.get("pandas", False)
 
-            if table == "Year" and pandas_flag:
-                # get_translated_urls用のDataFrame
-                return pd.DataFrame(
-                    [{"year": self.year}, {"year": 2025}, {"year": 2024}]
-                )
+            if table == "Year":
+                # 年度一覧・終了日時・翻訳済URLの展開に使う全年度分のデータ
+                return [
+                    {"year": year, "categories": [1], "ends_at": None}
+                    for year in (self.year, 2025, 2024)
+                ]
             return []
 
         mock_context_supabase.get_data.side_effect = mock_context_get_data_side_effect
@@ -289,3 +289,15 @@ class ViewsTestCase(unittest.TestCase):
 
         # COMEBACK Wildcardが正しく処理されていることを確認
         # （実際のソート順序はビュー内で処理されるため、レスポンスに含まれることを確認）
+
+    @patch("app.views.common.get_available_years")
+    def test_top_redirect_uses_latest_year_when_current_year_missing(
+        self, mock_get_available_years
+    ):
+        """今年の年度が無い場合、降順の年度一覧の先頭へリダイレクトすることを確認"""
+        mock_get_available_years.return_value = [2010, 2009]
+
+        response = self.client.get("/")
+
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(response.headers["Location"].endswith("/2010/top"))
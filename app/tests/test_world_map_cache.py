@@ -276,3 +276,16 @@ class WorldMapCacheTestCase(unittest.TestCase):
             self.assertEqual(
                 rendered_templates, [expected_template_a, expected_template_b]
             )
+
+    def test_render_flag_code_matches_flag_code_format(self):
+        """render_flag_codeがFLAG_CODE.formatと同じHTMLを返すことを確認"""
+        from app.config.config import FLAG_CODE
+        from app.views.world_map import render_flag_code
+
+        # iso_alpha2 が NULL の国でも例外にならず、format と同じ結果になる
+        for iso_alpha2 in ["jp", "kr", "us", None]:
+            with self.subTest(iso_alpha2=iso_alpha2):
+                self.assertEqual(
+                    render_flag_code(iso_alpha2),
+                    FLAG_CODE.format(iso_alpha2=iso_alpha2),
+                )
@@ -5,7 +5,7 @@ from urllib.parse import parse_qs, urlparse
 from flask import jsonify, request, session
 
 from app.config.config import (
-    BAN_WORDS,
+    BAN_WORDS_PATTERN,
     FACEBOOK_ACCOUNT_PATTERN,
     INSTAGRAM_ACCOUNT_PATTERN,
     SOUNDCLOUD_ACCOUNT_PATTERN,
@@ -166,14 +166,10 @@ def beatboxer_tavily_search(
 
     # 禁止ワードが一切含まれないもののみsearch_resultsに追加
     for item in search_results_unfiltered:
-        title_upper = item["title"].upper()
-        url_upper = item["url"].upper()
-        content_upper = item["content"].upper()
-        if not any(
-            ban_word in title_upper
-            or ban_word in url_upper
-            or ban_word in content_upper
-            for ban_word in BAN_WORDS
+        if not (
+            BAN_WORDS_PATTERN.search(item["title"])
+            or BAN_WORDS_PATTERN.search(item["url"])
+            or BAN_WORDS_PATTERN.search(item["content"])
         ):
             search_results.append(item)
 
@@ -209,12 +205,12 @@ def beatboxer_tavily_search(
         is_account_url = (
             ("@" in item["url"])
             or ("@" in item["title"])
-            or bool(re.match(FACEBOOK_ACCOUNT_PATTERN, item["url"]))
-            or bool(re.match(INSTAGRAM_ACCOUNT_PATTERN, item["url"]))
-            or bool(re.match(SOUNDCLOUD_ACCOUNT_PATTERN, item["url"]))
-            or bool(re.match(SPOTIFY_ACCOUNT_PATTERN, item["url"]))
-            or bool(re.match(TWITTER_ACCOUNT_PATTERN, item["url"]))
-            or bool(re.match(YOUTUBE_CHANNEL_PATTERN, item["url"]))
+            or bool(FACEBOOK_ACCOUNT_PATTERN.match(item["url"]))
+            or bool(INSTAGRAM_ACCOUNT_PATTERN.match(item["url"]))
+            or bool(SOUNDCLOUD_ACCOUNT_PATTERN.match(item["url"]))
+            or bool(SPOTIFY_ACCOUNT_PATTERN.match(item["url"]))
+            or bool(TWITTER_ACCOUNT_PATTERN.match(item["url"]))
+            or bool(YOUTUBE_CHANNEL_PATTERN.match(item["url"]))
         )
         is_new_domain = primary_domain not in account_domains_seen
 
@@ -21,11 +21,13 @@ def top_redirect_view():
     Returns:
         redirect: 最新年度のトップページへのリダイレクト
     """
+    current_year = datetime.now().year
     available_years = get_available_years()
-    if datetime.now().year in available_years:
-        latest_year = datetime.now().year
+    if current_year in available_years:
+        latest_year = current_year
     else:
-        latest_year = max(available_years)
+        # 年度一覧は降順で返るため、先頭が最新年度
+        latest_year = available_years[0]
 
     language = get_validated_language(session)
 
@@ -99,8 +99,10 @@ def post_search(year: int, IS_LOCAL: bool, IS_PULL_REQUEST: bool):
     # 全角数字・アルファベットを半角に変換
     question = unicodedata.normalize("NFKC", question)
 
-    if question.upper() in SEARCH_CACHE:
-        url = SEARCH_CACHE[question.upper()].replace("__year__", str(year))
+    # 完全一致のみキャッシュから返す（大文字化は1回だけ行う）
+    cached_url = SEARCH_CACHE.get(question.upper())
+    if cached_url is not None:
+        url = cached_url.replace("__year__", str(year))
 
     else:
         print(f"question: {question}", flush=True)
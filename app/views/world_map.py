@@ -1,5 +1,6 @@
 import os
 from collections import defaultdict
+from functools import lru_cache
 
 import folium
 from flask import abort, render_template, session
@@ -15,6 +16,28 @@ from app.models.supabase_client import supabase_service
 from app.util.locale import get_validated_language
 from app.util.participant_edit import wildcard_rank_sort
 
+# {iso_alpha2} で分割しておき、国旗HTMLは join だけで組み立てる
+_FLAG_CODE_PARTS = tuple(FLAG_CODE.split("{iso_alpha2}"))
+
+
+# MARK: 国旗HTML
+@lru_cache(maxsize=256)
+def render_flag_code(iso_alpha2: str | None) -> str:
+    """
+    国コードから国旗表示用のHTMLを生成する。
+
+    Args:
+        iso_alpha2 (str | None): ISO 3166-1 alpha-2 の国コード。未登録の国は None。
+
+    Returns:
+        str: FLAG_CODE の {iso_alpha2} を国コードで置換したHTML。
+
+    Note:
+        国コードは高々250種類程度なので、全件をキャッシュできる。
+        iso_alpha2 は NULL 許容のため、FLAG_CODE.format と同じく文字列化してから埋め込む。
+    """
+    return str(iso_alpha2).join(_FLAG_CODE_PARTS)
+
 
 # MARK: 世界地図
 def world_map_view(year: int):
@@ -178,7 +201,7 @@ def world_map_view(year: int):
 
         popup_content = f'<div style="{style}">'
 
-        flag_code = FLAG_CODE.format(iso_alpha2=iso_alpha2)
+        flag_code = render_flag_code(iso_alpha2)
 
         country_header = f'<h3 style="margin: 0; color: #ff6417; font-weight: bold;">{flag_code}{country_name}</h3>'
         team_info = f'<h4 style="margin: 0; color: #ff6417; font-weight: bold;">{len(participants)} team(s)</h4>'